@@ -1,10 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import logging
+import os
 import pyroyale
+import tempfile
+import time
 
+from crtools import io
 from crtools import leagueinfo
 
 logger = logging.getLogger(__name__)
 
+API_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'crtools')
+
+class CachedResponse:
+    """ Stands in for an HTTP response, so that a cached response body can be
+    deserialized by the API client. """
+    def __init__(self, data):
+        self.data = data
+
 class ApiWrapper:
     def __init__(self, config):
         self.config = config
@@ -17,9 +32,73 @@ class ApiWrapper:
         if config['api']['proxy_headers']:
             api_config.proxy_headers = config['api']['proxy_headers']
 
-        self.clans = pyroyale.ClansApi(pyroyale.ApiClient(api_config))
-        self.players = pyroyale.PlayersApi(pyroyale.ApiClient(api_config))
-
+        # Share a single client between the API groups so that every call
+        # goes through the same connection pool, and keep-alive connections
+        # to the API server get reused rather than re-negotiated.
+        self.api_client = pyroyale.ApiClient(api_config)
+        # urllib3 doesn't ask for compressed responses on its own, but will
+        # transparently decompress them if the server sends them.
+        self.api_client.set_default_header('Accept-Encoding', 'gzip')
+        self.clans = pyroyale.ClansApi(self.api_client)
+        self.players = pyroyale.PlayersApi(self.api_client)
+
+
+    def get_cached(self, response_type, api_method, *args):
+        """ Calls API method, caching the raw response on disk for the
+        number of seconds configured in cache_ttl. If cache_ttl is 0, the
+        cache is bypassed entirely. """
+        cache_ttl = self.config['api']['cache_ttl']
+        if not cache_ttl:
+            return api_method(*args)
+
+        cache_key = '{}:{}'.format(response_type, ':'.join(args))
+        cache_path = os.path.join(API_CACHE_DIR, hashlib.sha1(cache_key.encode('utf-8')).hexdigest() + '.json')
+
+        data = self.read_cache(cache_path, cache_ttl)
+        if data is None:
+            response = api_method(*args, _preload_content=False)
+            data = response.data
+            response.release_conn()
+
+            self.write_cache(cache_path, data)
+        else:
+            logger.debug('Using cached {} from {}'.format(response_type, cache_path))
+
+        return self.api_client.deserialize(CachedResponse(data), response_type)
+
+    def read_cache(self, cache_path, cache_ttl):
+        """ Returns the cached response body if it's fresh and intact.
+        Otherwise, returns None, and the caller should treat it as a miss. """
+        try:
+            if time.time() - os.path.getmtime(cache_path) >= cache_ttl:
+                return None
+
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+
+            # make sure the cached body is valid JSON before we trust it
+            io.load_json(data)
+            return data
+        except (OSError, ValueError) as e:
+            logger.debug('Could not read API cache {}: {}'.format(cache_path, e))
+            return None
+
+    def write_cache(self, cache_path, data):
+        """ Writes response body to the cache. The body is written to a
+        temporary file first, and then renamed into place, so that nobody
+        ever reads a partially written file. Failing to write the cache is
+        not an error. """
+        temp_path = None
+        try:
+            os.makedirs(API_CACHE_DIR, mode=0o700, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=API_CACHE_DIR, delete=False) as f:
+                temp_path = f.name
+                f.write(data)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.debug('Could not write API cache {}: {}'.format(cache_path, e))
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
 
     def get_war_readiness_for_member(self, member_tag, war_trophies):
 
@@ -68,10 +147,17 @@ class ApiWrapper:
 
     def get_data_from_api(self): # pragma: no coverage
         try:
-            # Get clan data and war log from API.
-            clan = self.clans.get_clan(self.config['api']['clan_id'])
-            warlog = self.clans.get_clan_war_log(self.config['api']['clan_id'])
-            current_war = self.clans.get_current_war(self.config['api']['clan_id'])
+            # Get clan data and war log from API. The requests are
+            # independent of each other, so fire them off concurrently.
+            clan_id = self.config['api']['clan_id']
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                clan_future = executor.submit(self.get_cached, 'Clan', self.clans.get_clan, clan_id)
+                warlog_future = executor.submit(self.get_cached, 'WarLog', self.clans.get_clan_war_log, clan_id)
+                current_war_future = executor.submit(self.get_cached, 'WarCurrent', self.clans.get_current_war, clan_id)
+
+            clan = clan_future.result()
+            warlog = warlog_future.result()
+            current_war = current_war_future.result()
 
             logger.info('- clan: {} ({})'.format(clan.name, clan.tag))
 
@@ -19,6 +19,16 @@ from crtools.models import Demerit, MemberVacation
 logger = logging.getLogger(__name__)
 
 PYPI_URL = 'https://pypi.org/pypi/crtools/json'
+
+PACKAGE_DIR = os.path.abspath(os.path.dirname(__file__))
+LOCALE_DIR = os.path.join(PACKAGE_DIR, 'locale')
+DEFAULT_LOGO_PATH = os.path.join(PACKAGE_DIR, 'templates', 'crtools-logo.png')
+DEFAULT_FAVICON_PATH = os.path.join(PACKAGE_DIR, 'templates', 'crtools-favicon.ico')
+
+STATIC_ASSETS_COPY = 'copy'
+STATIC_ASSETS_HARDLINK = 'hardlink'
+STATIC_ASSETS_SYMLINK = 'symlink'
+STATIC_ASSETS_MODES = [STATIC_ASSETS_COPY, STATIC_ASSETS_HARDLINK, STATIC_ASSETS_SYMLINK]
 LOCALE_LIST = {
     'cn': 'Chinese',
     'de': 'German',
@@ -39,7 +49,8 @@ config_defaults = {
         'api_key'                       : False,
         'clan_id'                       : False,
         'proxy'                         : '',
-        'proxy_headers'                 : ''
+        'proxy_headers'                 : '',
+        'cache_ttl'                     : 0
     },
     'paths' : {
         'out'                           : './crtools-out',
@@ -47,7 +58,8 @@ config_defaults = {
         'clan_logo'                     : False,
         'description_html'              : False,
         'temp_dir_name'                 : 'crtools',
-        'use_fankit'                    : False
+        'use_fankit'                    : False,
+        'link_static_assets'            : STATIC_ASSETS_COPY
     },
     'www' : {
         'canonical_url'                 : False
@@ -148,8 +160,7 @@ def __localize_strings(locale_id):
     except locale.Error:
         print('Locale time setting not found in your os for "{}"'.format(locale_id))
 
-    localedir = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'locale')
-    translate = gettext.translation('crtools', localedir, languages=[locale_id], fallback=True)
+    translate = gettext.translation('crtools', LOCALE_DIR, languages=[locale_id], fallback=True)
     _ = translate.gettext
 
     return {
@@ -347,6 +358,25 @@ def __localize_strings(locale_id):
         'footerSeeContentPolicy'    : _("For more information see Supercell's Fan Content Policy.")
     }
 
+def __validate_api_settings(config):
+    logger = logging.getLogger(__name__)
+
+    # cache_ttl must be a non-negative number of seconds. Anything else
+    # disables the cache.
+    cache_ttl = config['api']['cache_ttl']
+    try:
+        if isinstance(cache_ttl, bool):
+            raise ValueError()
+        cache_ttl = float(cache_ttl)
+        if not cache_ttl >= 0:
+            raise ValueError()
+    except ValueError:
+        logger.warn('cache_ttl must be a non-negative number of seconds; got "{}". Disabling the API cache.'.format(config['api']['cache_ttl']))
+        cache_ttl = 0
+    config['api']['cache_ttl'] = cache_ttl
+
+    return config
+
 def __validate_crtools_settings(config):
     if config['crtools']['debug'] == True:
         logging.basicConfig(level=logging.DEBUG)
@@ -360,7 +390,7 @@ def __validate_paths(config):
 
     # If logo_path is provided, use logo from path given, and put it where
     # it needs to go. Otherwise, use the default from the template folder
-    logo_src_path = os.path.join(os.path.dirname(__file__), 'templates', 'crtools-logo.png')
+    logo_src_path = DEFAULT_LOGO_PATH
     if config['paths']['clan_logo']:
         logo_src_path_test = os.path.expanduser(config['paths']['clan_logo'])
         if os.path.isfile(logo_src_path_test):
@@ -371,7 +401,7 @@ def __validate_paths(config):
 
     # If favicon_path is provided, use favicon from path given, and put it
     # where it needs to go. Otherwise, use the default from the template folder
-    favicon_src_path = os.path.join(os.path.dirname(__file__), 'templates', 'crtools-favicon.ico')
+    favicon_src_path = DEFAULT_FAVICON_PATH
     if config['paths']['favicon']:
         favicon_src_path_test = os.path.expanduser(config['paths']['favicon'])
         if os.path.isfile(favicon_src_path_test):
@@ -392,6 +422,10 @@ def __validate_paths(config):
         else:
             logger.warn('custom description file "{}" not found. Using default instead.'.format(description_path))
 
+    if config['paths']['link_static_assets'] not in STATIC_ASSETS_MODES:
+        logger.warn('link_static_assets must be one of {}; got "{}". Using "{}" instead.'.format(', '.join(STATIC_ASSETS_MODES), config['paths']['link_static_assets'], STATIC_ASSETS_COPY))
+        config['paths']['link_static_assets'] = STATIC_ASSETS_COPY
+
     return config
 
 def __parse_value(new_value, template_value):
@@ -470,6 +504,7 @@ def load_config_file(config_file_name=None, check_for_update=False, locale=None)
                         config[section_key][key] = __parse_value(value, config[section_key][key])
 
     config = __validate_paths(config)
+    config = __validate_api_settings(config)
     config = __validate_crtools_settings(config)
     config = __process_special_status(config)
 
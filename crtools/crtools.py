@@ -4,11 +4,9 @@
 __license__   = 'LGPLv3'
 __docformat__ = 'reStructuredText'
 
-from datetime import datetime
 import logging
 import os
 import shutil
-import tempfile
 
 import pyroyale
 import json
@@ -20,7 +18,8 @@ from crtools import fankit
 from crtools import io
 from crtools import discord
 from crtools.memberfactory import MemberFactory
-from crtools.models import FormerMember, ProcessedClan, ProcessedCurrentWar
+from crtools.timeutil import parse_api_timestamp
+from crtools.models import FormerMember, ProcessedClan, ProcessedCurrentWar, ProcessedRecentWar
 
 MAX_CLAN_SIZE = 50
 
@@ -147,14 +146,14 @@ def process_absent_members(config, historical_members):
 def process_recent_wars(config, warlog):
     wars = []
     for war in warlog.items:
-        clan = None
         for rank, war_clan in enumerate(war.standings):
             if war_clan.clan.tag == config['api']['clan_id']:
-                clan = war_clan
-                clan.rank = rank+1
-                date = datetime.strptime(war.created_date.split('.')[0], '%Y%m%dT%H%M%S')
-                clan.date = config['strings']['labelWarDate'].format(month=date.month, day=date.day)
-                wars.append(clan)
+                date = parse_api_timestamp(war.created_date)
+                wars.append(ProcessedRecentWar(
+                    war_standing=war_clan,
+                    rank=rank+1,
+                    date=config['strings']['labelWarDate'].format(month=date.month, day=date.day)
+                ))
 
     return wars
 
@@ -182,16 +181,16 @@ def build_dashboard(config): # pragma: no coverage
     if config['member_table']['calc_war_readiness'] == True:
         war_readiness_map = api.get_war_readiness_map(clan.member_list, clan.clan_war_trophies)
 
+    output_path = os.path.expanduser(config['paths']['out'])
+
     # Create temporary directory. All file writes, until the very end,
     # will happen in this directory, so that no matter what we do, it
     # won't hose existing stuff.
-    tempdir = tempfile.mkdtemp(config['paths']['temp_dir_name'])
+    tempdir = io.make_temp_dir(output_path, config['paths']['temp_dir_name'])
 
     # Putting everything in a `try`...`finally` to ensure `tempdir` is removed
     # when we're done. We don't want to pollute the user's disk.
     try:
-        output_path = os.path.expanduser(config['paths']['out'])
-
         # process data from API
         current_war_processed = ProcessedCurrentWar(current_war, config)
         clan_processed = ProcessedClan(clan, current_war_processed, config)
@@ -234,7 +233,7 @@ def build_dashboard(config): # pragma: no coverage
         # if fankit is enabled, it will download it.
         fankit.get_fankit(tempdir, output_path, config['paths']['use_fankit'])
 
-        io.copy_static_assets(tempdir, config['paths']['clan_logo'], config['paths']['favicon'])
+        io.copy_static_assets(tempdir, config['paths']['clan_logo'], config['paths']['favicon'], config['paths']['link_static_assets'])
 
         io.move_temp_to_output_dir(tempdir, output_path)
 
@@ -1,10 +1,10 @@
-from datetime import datetime
 from discord_webhook import DiscordEmbed, DiscordWebhook
 import logging
 import math
 from requests.exceptions import ConnectionError
 
 from ._version import __version__
+from crtools.timeutil import parse_api_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ class WarNagConfig:
                 self.abort = True
                 return
 
-            war_end_timestamp = datetime.strptime(current_war.collection_end_time.split('.')[0], '%Y%m%dT%H%M%S')
+            war_end_timestamp = parse_api_timestamp(current_war.collection_end_time)
             nag_threshold = config['discord']['nag_collection_battle_hours_left']
             war_day_label = config['strings']['discord-collection-label']
 
@@ -45,7 +45,7 @@ class WarNagConfig:
             if config['discord']['nag_war_battle'] == False:
                 self.abort = True
                 return
-            war_end_timestamp = datetime.strptime(current_war.war_end_time.split('.')[0], '%Y%m%dT%H%M%S')
+            war_end_timestamp = parse_api_timestamp(current_war.war_end_time)
             nag_threshold = config['discord']['nag_war_battle_hours_left']
             war_day_label = config['strings']['discord-war-label']
 
@@ -1,12 +1,18 @@
-import codecs
 from datetime import datetime, date, timezone, timedelta
-from jinja2 import Environment, PackageLoader, StrictUndefined, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, StrictUndefined, select_autoescape
 import json
 import logging
 import os
 import shutil
+import tempfile
+
+try:
+    import orjson
+except ImportError: # pragma: no coverage
+    orjson = None
 
 from ._version import __version__
+from crtools.config import PACKAGE_DIR, STATIC_ASSETS_COPY, STATIC_ASSETS_HARDLINK, STATIC_ASSETS_SYMLINK
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +21,11 @@ HISTORY_FILE_NAME = 'history.json'
 CLAN_LOG_FILENAME = 'clan_logo.png'
 FAVICON_FILENAME = 'favicon.ico'
 
+STATIC_DIR = os.path.join(PACKAGE_DIR, 'static')
+
+TEMPLATE_WRITE_BUFFER_SIZE = 64 * 1024
+FILE_WRITE_BUFFER_SIZE = 256 * 1024
+
 MEMBER_TABLE_CSS_MAPPING = {
     'show_rank'                 : 'rank',
     'show_rank_previous'        : 'rank.previous',
@@ -33,23 +44,98 @@ MEMBER_TABLE_CSS_MAPPING = {
     'show_warlog'               : 'war.previous'
 }
 
+_jinja_env = None
+_templates = {}
+
+def get_bytecode_cache():
+    """ Returns an on-disk cache for compiled templates, so that runs after
+    the first one can skip compiling them. Jinja keeps this in a per-user
+    directory, and refuses to use it if it's not owned by the current user.
+    If the cache can't be used, templates will simply be compiled on every
+    run. """
+    try:
+        return FileSystemBytecodeCache()
+    except (RuntimeError, OSError) as e:
+        logger.debug('Could not use template cache directory: {}'.format(e))
+        return None
+
+def get_jinja_env():
+    """ Returns the template environment, creating it on first use. The
+    environment is kept for the life of the process so that compiled
+    templates are cached between renders. """
+    global _jinja_env
+
+    if _jinja_env is None:
+        _jinja_env = Environment(
+            loader=PackageLoader('crtools', 'templates'),
+            autoescape=select_autoescape(['html', 'xml']),
+            undefined=StrictUndefined,
+            auto_reload=False,
+            bytecode_cache=get_bytecode_cache()
+        )
+
+    return _jinja_env
+
+def get_template(name):
+    """ Returns the named template, loading it on first use and caching
+    it so that subsequent renders skip the environment lookup. """
+    if name not in _templates:
+        _templates[name] = get_jinja_env().get_template(name)
+
+    return _templates[name]
+
 def json_dumper(obj):
     try:
         return obj.to_dict()
     except:
         return obj.__dict__
 
+def dump_json(obj):
+    """ Serializes object to UTF-8 encoded JSON. Uses orjson if it's
+    installed, as it's much faster than the standard library. Both produce
+    the same format: two-space indents, with non-ASCII characters written
+    as UTF-8 rather than escaped. """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=json_dumper, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson is stricter than the standard library (e.g. it won't
+            # serialize non-string keys), so fall back to the standard library
+            pass
+
+    return json.dumps(obj, default=json_dumper, indent=2, ensure_ascii=False).encode('utf-8')
+
+def load_json(data):
+    """ Deserializes JSON. Uses orjson if it's installed. """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
 def write_object_to_file(file_path, obj):
-    """ Writes contents of object to file. If object is a string, write it
-    directly. Otherwise, convert it to JSON first """
+    """ Writes contents of object to file. If object is bytes or a string,
+    write it directly. Otherwise, convert it to JSON first """
+
+    # encode contents of object as UTF-8, and write them to file in one go
+    if isinstance(obj, (bytes, bytearray)):
+        data = obj
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8')
+    else:
+        data = dump_json(obj)
+
+    with open(file_path, 'wb', buffering=FILE_WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+
+def make_temp_dir(output_dir, suffix):
+    """ Creates a temporary directory for staging output. If possible, it's
+    created next to the output directory, so that its contents can be
+    renamed into place rather than copied. """
+    parent_dir = os.path.dirname(os.path.abspath(output_dir))
+    if not (os.path.isdir(parent_dir) and os.access(parent_dir, os.W_OK)):
+        parent_dir = None
 
-    # open file for UTF-8 output, and write contents of object to file
-    with codecs.open(file_path, 'w', 'utf-8') as f:
-        if isinstance(obj, str):
-            string = obj
-        else:
-            string = json.dumps(obj, default=json_dumper, indent=4)
-        f.write(string)
+    return tempfile.mkdtemp(suffix, dir=parent_dir)
 
 def get_previous_history(output_dir):
     """ grab history, if it exists, from output paths """
@@ -61,12 +147,34 @@ def get_previous_history(output_dir):
     if not os.path.isfile(history_path):
         return None
 
-    with open(history_path, 'r') as myfile:
-        return json.loads(myfile.read())
+    with open(history_path, 'rb') as myfile:
+        return load_json(myfile.read())
 
-def copy_static_assets(tempdir, clan_logo_path, favicon_path):
-    # copy static assets to output path
-    shutil.copytree(os.path.join(os.path.dirname(__file__), 'static'), os.path.join(tempdir, 'static'))
+def link_or_copy_file(src, dst):
+    """ Hard links file if possible, so no data gets copied. Hard links
+    can't cross file systems, so fall back to copying in that case. """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def copy_static_assets(tempdir, clan_logo_path, favicon_path, mode=STATIC_ASSETS_COPY):
+    # By default, copy static assets to the output path, so that the output
+    # is self-contained. Optionally, hard link the files, or symlink the
+    # whole directory, to avoid copying data. Note that linked files are
+    # shared with the installed package, so changing their ownership or
+    # contents in the output path changes the package as well.
+    static_dest_path = os.path.join(tempdir, 'static')
+    if mode == STATIC_ASSETS_SYMLINK:
+        try:
+            os.symlink(STATIC_DIR, static_dest_path, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            logger.warn('Could not symlink static assets. Copying them instead.')
+            shutil.copytree(STATIC_DIR, static_dest_path)
+    elif mode == STATIC_ASSETS_HARDLINK:
+        shutil.copytree(STATIC_DIR, static_dest_path, copy_function=link_or_copy_file)
+    else:
+        shutil.copytree(STATIC_DIR, static_dest_path)
 
     # copy user-provided assets to the output path
     shutil.copyfile(clan_logo_path, os.path.join(tempdir, CLAN_LOG_FILENAME))
@@ -74,46 +182,41 @@ def copy_static_assets(tempdir, clan_logo_path, favicon_path):
 
 
 def parse_templates(config, history, tempdir, clan, members, former_members, current_war, recent_wars, suggestions, scoring_rules): # pragma: no coverage
-    # Create environment for template parser
-    env = Environment(
-        loader=PackageLoader('crtools', 'templates'),
-        autoescape=select_autoescape(['html', 'xml']),
-        undefined=StrictUndefined
-    )
-
     hidden_columns = []
     for key, value in MEMBER_TABLE_CSS_MAPPING.items():
         if config['member_table'][key] != True:
             hidden_columns.append(value)
 
-    dashboard_html = env.get_template('page.html.j2').render(
-        version           = __version__,
-        config            = config,
-        strings           = config['strings'],
-        update_date       = datetime.now().strftime('%c'),
-        members           = members,
-        clan              = clan,
-        clan_hero         = config['paths']['description_html_src'],
-        current_war       = current_war,
-        recent_wars       = recent_wars,
-        suggestions       = suggestions,
-        scoring_rules     = scoring_rules,
-        former_members    = former_members,
-        hidden_columns    = hidden_columns
-    )
-
-    write_object_to_file(os.path.join(tempdir, 'index.html'), dashboard_html)
+    # stream the dashboard straight to disk, rather than rendering the
+    # whole page into memory first
+    with open(os.path.join(tempdir, 'index.html'), 'w', encoding='utf-8', newline='', buffering=TEMPLATE_WRITE_BUFFER_SIZE) as f:
+        get_template('page.html.j2').stream(
+            version           = __version__,
+            config            = config,
+            strings           = config['strings'],
+            update_date       = datetime.now().strftime('%c'),
+            members           = members,
+            clan              = clan,
+            clan_hero         = config['paths']['description_html_src'],
+            current_war       = current_war,
+            recent_wars       = recent_wars,
+            suggestions       = suggestions,
+            scoring_rules     = scoring_rules,
+            former_members    = former_members,
+            hidden_columns    = hidden_columns
+        ).dump(f)
+
     write_object_to_file(os.path.join(tempdir, HISTORY_FILE_NAME), history)
 
     # If canonical URL is provided, also render the robots.txt and
     # sitemap.xml
     if config['www']['canonical_url'] != False:
         lastmod = config['crtools']['timestamp'].replace(tzinfo=timezone.utc).isoformat()
-        sitemap_xml = env.get_template('sitemap.xml.j2').render(
+        sitemap_xml = get_template('sitemap.xml.j2').render(
                 url     = config['www']['canonical_url'],
                 lastmod = lastmod
             )
-        robots_txt = env.get_template('robots.txt.j2').render(
+        robots_txt = get_template('robots.txt.j2').render(
                 canonical_url = config['www']['canonical_url']
             )
         write_object_to_file(os.path.join(tempdir, 'sitemap.xml'), sitemap_xml)
@@ -132,7 +235,7 @@ def move_temp_to_output_dir(tempdir, output_dir):
         try:
             for file in os.listdir(output_dir):
                 file_path = os.path.join(output_dir, file)
-                if os.path.isfile(file_path):
+                if os.path.isfile(file_path) or os.path.islink(file_path):
                     os.unlink(file_path)
                 elif os.path.isdir(file_path):
                     shutil.rmtree(file_path)
@@ -146,13 +249,18 @@ def move_temp_to_output_dir(tempdir, output_dir):
         except PermissionError as e: # pragma: no coverage
             logger.error('Permission error: could create output folder: \n\t{}'.format(e.filename))
 
-    # Copy all contents of temp directory to output directory
+    # Move all contents of temp directory to output directory. If both are
+    # on the same file system, this is a rename, and no data gets copied.
     # NOTE: not in try/catch block because if the above executed, we already
     # have sufficient privileges to write to the output directory
     for file in os.listdir(tempdir):
         file_path = os.path.join(tempdir, file)
         file_out_path = os.path.join(output_dir, file)
-        if os.path.isfile(file_path):
-            shutil.copyfile(file_path, file_out_path)
-        elif os.path.isdir(file_path):
-            shutil.copytree(file_path, file_out_path)
+        try:
+            os.replace(file_path, file_out_path)
+        except OSError:
+            # Can't rename across file systems; copy instead
+            if os.path.isfile(file_path):
+                shutil.copyfile(file_path, file_out_path)
+            elif os.path.isdir(file_path):
+                shutil.copytree(file_path, file_out_path)
@@ -4,6 +4,7 @@ import logging
 from crtools.models import Demerit, ProcessedMember, WarParticipation
 from crtools import history
 from crtools.scorecalc import ScoreCalculator
+from crtools.timeutil import parse_api_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,10 @@ class MemberFactory:
         self.history_start_timestamp = member_history['history_start']
         self.max_days_from_join = (self.now - datetime.fromtimestamp(self.history_start_timestamp)).days
 
+        # index war participants by tag once, rather than once per member
+        self.current_war_participants = WarParticipation.index_participants(current_war) if current_war else {}
+        self.warlog_participants = [WarParticipation.index_participants(war) for war in warlog.items] if warlog else []
+
 
     def get_processed_member(self, member, war_readiness=None):
         processed_member = ProcessedMember(member, war_readiness)
@@ -40,7 +45,7 @@ class MemberFactory:
         member.days_inactive = member.days_inactive if member.days_inactive >= 0 else 0
 
         if member.last_seen:
-            last_seen = datetime.strptime(member.last_seen.split('.')[0], '%Y%m%dT%H%M%S')
+            last_seen = parse_api_timestamp(member.last_seen)
         else:
             last_seen = config['crtools']['timestamp']
 
@@ -129,20 +134,31 @@ class MemberFactory:
             member.vacation = True
 
     def calc_derived_member_stats(self, member):
-        member.current_war = WarParticipation(self.config, member, self.current_war)
+        member.current_war = WarParticipation(self.config, member, self.current_war, self.current_war_participants)
+
+        # build the member's warlog, and in the same pass, tally up the
+        # war score and the stats needed for recent war stats
         member.warlog = []
-        for war in self.warlog.items:
-            member.warlog.append(WarParticipation(self.config, member, war))
+        member.war_score = 0
+        war_tally = {
+            'war_wins': 0,
+            'war_battles': 0,
+            'collection_wins': 0,
+            'collection_cards': 0
+        }
+        for war, participants in zip(self.warlog.items, self.warlog_participants):
+            participation = WarParticipation(self.config, member, war, participants)
+            member.warlog.append(participation)
+            member.war_score += participation.score
+            war_tally['war_wins'] += participation.wins
+            war_tally['war_battles'] += participation.number_of_battles
+            war_tally['collection_wins'] += participation.collection_battle_wins
+            war_tally['collection_cards'] += participation.collection_win_cards
 
         score_calc = ScoreCalculator(self.config)
 
         member.donation_score = score_calc.get_member_donations_score(member)
 
-        # calculate score based on war participation
-        member.war_score = 0
-        for war in member.warlog:
-            member.war_score += war.score
-
         # get member score
         member.score = member.war_score + member.donation_score
 
@@ -170,7 +186,7 @@ class MemberFactory:
         # Figure out whether member is on the leadership team by role
         member.leadership = member.role == 'leader' or member.role == 'coLeader'
 
-        self.calc_recent_war_stats(member)
+        self.calc_recent_war_stats(member, **war_tally)
 
     def get_role_label(self, member_tag, member_role, days_inactive, activity_status, vacation, blacklisted, no_promote):
         """ Format roles in sane way """
@@ -200,20 +216,9 @@ class MemberFactory:
             'member'   : self.config['strings']['roleMember'],
         }[member_role]
 
-    def calc_recent_war_stats(self, member):
-        war_wins = 0
-        war_battles = 0
-        collection_wins = 0
-        collection_cards = 0
-        for war in member.warlog:
-            if hasattr(war, 'wins'):
-                war_wins += war.wins
-                war_battles += war.number_of_battles
-            if hasattr(war, 'collection_battle_wins'):
-                collection_wins += war.collection_battle_wins
-            if hasattr(war, 'collection_win_cards'):
-                collection_cards += war.collection_win_cards
-
+    def calc_recent_war_stats(self, member, war_wins, war_battles, collection_wins, collection_cards):
+        """ calculate recent war stats from totals tallied over the member's
+        warlog """
         if war_battles > 0:
             member.war_win_rate = round((war_wins/war_battles) * 100)
         else:
@@ -6,5 +6,6 @@ from crtools.models.memberevent import MemberEvent
 from crtools.models.vacation import MemberVacation
 from crtools.models.clan import ProcessedClan
 from crtools.models.processedmember import ProcessedMember
+from crtools.models.recentwar import ProcessedRecentWar
 from crtools.models.war import ProcessedCurrentWar
 from crtools.models.warparticipation import WarParticipation
@@ -0,0 +1,18 @@
+class ProcessedRecentWar():
+    """ Our clan's result in a war from the warlog. Holds on to the clan's
+    standing from the API, rather than adding our own fields to it, so that
+    the API response is left untouched. """
+
+    def __init__(self, war_standing, rank, date):
+        self.clan = war_standing.clan
+        self.trophy_change = war_standing.trophy_change
+        self.rank = rank
+        self.date = date
+
+    def to_dict(self):
+        return {
+            'clan'          : self.clan.to_dict(),
+            'trophy_change' : self.trophy_change,
+            'rank'          : self.rank,
+            'date'          : self.date
+        }
@@ -1,9 +1,10 @@
-from datetime import datetime
 import logging
 import math
 
 from pyroyale import WarCurrent
 
+from crtools.timeutil import parse_api_timestamp
+
 class ProcessedCurrentWar:
 
     cards = 0
@@ -39,14 +40,14 @@ class ProcessedCurrentWar:
         if self.state == 'collectionDay':
             self.state_label = config['strings']['labelStateCollectionDay']
 
-            collection_end_time = datetime.strptime(self.collection_end_time.split('.')[0], '%Y%m%dT%H%M%S')
+            collection_end_time = parse_api_timestamp(self.collection_end_time)
             collection_end_time_delta = math.floor((collection_end_time - now).seconds / 3600)
             self.collection_end_time_label = config['strings']['labelCollectionEndTime'].format(collection_end_time_delta)
             self.end_label = config['strings']['labelEndTime'].format(collection_end_time_delta)
         else:
             self.state_label = config['strings']['labelStateWarDay']
 
-            end_time = datetime.strptime(self.war_end_time.split('.')[0], '%Y%m%dT%H%M%S')
+            end_time = parse_api_timestamp(self.war_end_time)
             end_time_delta = math.floor((end_time - now).seconds / 3600)
             self.collection_end_time_label = config['strings']['labelCollectionComplete']
             self.end_label = config['strings']['labelCollectionEndTime'].format(end_time_delta)
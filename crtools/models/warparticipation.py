@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 
 from crtools import leagueinfo
 from crtools.scorecalc import ScoreCalculator
+from crtools.timeutil import parse_api_timestamp
 
 def _get_war_date(war):
     """ returns the datetime this war was created. If it's an ongoing
@@ -12,46 +13,53 @@ def _get_war_date(war):
 
     if hasattr(war, 'state') :
         if war.state == 'warDay':
-            war_date_raw = datetime.strptime(war.war_end_time.split('.')[0], '%Y%m%dT%H%M%S')
+            war_date_raw = parse_api_timestamp(war.war_end_time)
             war_date_raw -= timedelta(days=2)
         elif war.state == 'collectionDay':
-            war_date_raw = datetime.strptime(war.collection_end_time.split('.')[0], '%Y%m%dT%H%M%S')
+            war_date_raw = parse_api_timestamp(war.collection_end_time)
             war_date_raw -= timedelta(days=1)
     else:
-        war_date_raw = datetime.strptime(war.created_date.split('.')[0], '%Y%m%dT%H%M%S')
+        war_date_raw = parse_api_timestamp(war.created_date)
         war_date_raw -= timedelta(days=1)
 
     return datetime.timestamp(war_date_raw)
 
 
+def _get_past_war_status(collection_day_battles, war_day_battles):
+    """ returns the status of a member in a completed war """
+    return ('na'   if collection_day_battles == 0 else
+            'bad'  if war_day_battles == 0 else
+            'ok'   if collection_day_battles < 3 else
+            'good')
+
 def _get_member_war_status_class(collection_day_battles, war_day_battles, war_date, join_date, current_war=False, war_day=False):
     """ returns CSS class(es) for a war log entry for a given member """
     if war_date < join_date:
         return 'not-in-clan'
 
+    if not current_war:
+        return _get_past_war_status(collection_day_battles, war_day_battles)
+
     status = 'normal'
-    if current_war:
-        if collection_day_battles < 3:
-            status = 'ok'
-        elif war_day and war_day_battles > 0:
-            status = 'good'
-
-        if war_day == False or war_day_battles == 0:
-            status += ' incomplete'
-    else:
-        if collection_day_battles == 0:
-            status = 'na'
-        elif war_day_battles == 0:
-            status = 'bad'
-        elif collection_day_battles < 3:
-            status = 'ok'
-        else:
-            status = 'good'
+    if collection_day_battles < 3:
+        status = 'ok'
+    elif war_day and war_day_battles > 0:
+        status = 'good'
+
+    if war_day == False or war_day_battles == 0:
+        status += ' incomplete'
     return status
 
 class WarParticipation():
 
-    def __init__(self, config, member, war):
+    @staticmethod
+    def index_participants(war):
+        """ returns a dict of the war's participants, keyed by player tag.
+        Build this once per war and pass it to the constructor, rather than
+        scanning the participant list once for every member. """
+        return {participant.tag: participant for participant in (war.participants or [])}
+
+    def __init__(self, config, member, war, participants=None):
         self.in_war = False
         self.status = 'na'
         self.score = 0
@@ -84,24 +92,29 @@ class WarParticipation():
             # member is not in this war
             self.score = ScoreCalculator(config).get_war_score(self)
 
-        for participant in war.participants:
-            if participant.tag == member_tag:
-                self.in_war = True
-                self.cards_earned = participant.cards_earned
-                self.battles_played = participant.battles_played
-                self.collection_day_battles_played = participant.collection_day_battles_played
-                self.wins = participant.wins
-                self.number_of_battles = participant.number_of_battles
+        if participants is None:
+            participants = WarParticipation.index_participants(war)
+
+        participant = participants.get(member_tag)
+        if participant is None:
+            return
+
+        self.in_war = True
+        self.cards_earned = participant.cards_earned
+        self.battles_played = participant.battles_played
+        self.collection_day_battles_played = participant.collection_day_battles_played
+        self.wins = participant.wins
+        self.number_of_battles = participant.number_of_battles
 
-                if hasattr(war, 'state'):
-                    self.status = _get_member_war_status_class(self.collection_day_battles_played, self.battles_played, war_date, join_date, True, war.state=='warDay')
-                    return;
+        if hasattr(war, 'state'):
+            self.status = _get_member_war_status_class(self.collection_day_battles_played, self.battles_played, war_date, join_date, True, war.state=='warDay')
+            return;
 
-                self.status = _get_member_war_status_class(self.collection_day_battles_played, self.battles_played, war_date, join_date)
+        self.status = _get_member_war_status_class(self.collection_day_battles_played, self.battles_played, war_date, join_date)
 
-                self.war_league = leagueinfo.get_war_league_from_war(war, config['api']['clan_id'])
-                self.collection_win_cards = leagueinfo.get_collection_win_cards(self.war_league, member.arena_league)
+        self.war_league = leagueinfo.get_war_league_from_war(war, config['api']['clan_id'])
+        self.collection_win_cards = leagueinfo.get_collection_win_cards(self.war_league, member.arena_league)
 
-                self.collection_battle_wins = round(self.cards_earned / self.collection_win_cards)
-                self.collection_battle_losses = self.collection_day_battles_played - self.collection_battle_wins
-                self.score = ScoreCalculator(config).get_war_score(self)
+        self.collection_battle_wins = round(self.cards_earned / self.collection_win_cards)
+        self.collection_battle_losses = self.collection_day_battles_played - self.collection_battle_wins
+        self.score = ScoreCalculator(config).get_war_score(self)
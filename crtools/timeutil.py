@@ -0,0 +1,12 @@
+from datetime import datetime
+from functools import lru_cache
+
+API_TIMESTAMP_FORMAT = '%Y%m%dT%H%M%S'
+
+@lru_cache(maxsize=128)
+def parse_api_timestamp(timestamp):
+    """ parses a timestamp from the API, e.g. '20190213T000000.000Z'. The
+    same handful of war timestamps get parsed for every member in the clan,
+    so results are cached. """
+    # the part before the fractional seconds is always 15 characters long
+    return datetime.strptime(timestamp[:15], API_TIMESTAMP_FORMAT)
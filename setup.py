@@ -48,6 +48,9 @@ setup(
 
     setup_requires=['babel'],
     install_requires=['jinja2','configparser','pyroyale>=1.0.3', 'requests', 'discord-webhook', 'google-api-python-client'],
+    extras_require={
+        'orjson': ['orjson'],
+    },
 
     include_package_data=True,
 
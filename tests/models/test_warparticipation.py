@@ -24,3 +24,13 @@ def test_get_war_date():
     assert warparticipation._get_war_date(pyroyale.WarCurrent(state='warDay', war_end_time=raw_date_string)) == datetime.timestamp(test_date - timedelta(days=2))
 
     assert warparticipation._get_war_date(pyroyale.WarCurrent(state='collectionDay', collection_end_time=raw_date_string)) == datetime.timestamp(test_date - timedelta(days=1))
+
+def test_index_participants():
+    participant_a = pyroyale.WarParticipant(tag='#AAAAAA')
+    participant_b = pyroyale.WarParticipant(tag='#BBBBBB')
+    war = pyroyale.War(participants=[participant_a, participant_b])
+
+    index = warparticipation.WarParticipation.index_participants(war)
+
+    assert index == {'#AAAAAA': participant_a, '#BBBBBB': participant_b}
+    assert warparticipation.WarParticipation.index_participants(pyroyale.War(participants=None)) == {}
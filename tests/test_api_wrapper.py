@@ -0,0 +1,118 @@
+import os
+
+import pyroyale
+from crtools import api_wrapper, load_config_file
+from crtools.api_wrapper import ApiWrapper
+
+CLAN_TAG = '#FakeClanTag'
+
+__config_file__ = '''
+[api]
+clan_id={}
+cache_ttl=60
+'''.format(CLAN_TAG)
+
+__fake_clan_json__ = b'{"tag": "#FakeClanTag", "name": "Fake Clan", "memberList": [{"tag": "#AAAAAA", "name": "Member"}]}'
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.released = False
+
+    def release_conn(self):
+        self.released = True
+
+class FakeApiMethod:
+    def __init__(self, data=__fake_clan_json__):
+        self.data = data
+        self.calls = []
+
+    def __call__(self, clan_tag, **kwargs):
+        self.calls.append((clan_tag, kwargs))
+        return FakeResponse(self.data)
+
+def get_api(tmpdir, monkeypatch, test_name):
+    config_file = tmpdir.mkdir(test_name).join('config.ini')
+    config_file.write(__config_file__)
+    cache_dir = tmpdir.join(test_name + '-cache')
+    monkeypatch.setattr(api_wrapper, 'API_CACHE_DIR', str(cache_dir))
+
+    return ApiWrapper(load_config_file(config_file.realpath())), cache_dir
+
+def test_get_cached_miss(tmpdir, monkeypatch):
+    api, cache_dir = get_api(tmpdir, monkeypatch, 'test_get_cached_miss')
+    get_clan = FakeApiMethod()
+
+    clan = api.get_cached('Clan', get_clan, CLAN_TAG)
+
+    assert get_clan.calls == [(CLAN_TAG, {'_preload_content': False})]
+    assert isinstance(clan, pyroyale.Clan)
+    assert clan.name == 'Fake Clan'
+    assert clan.member_list[0].tag == '#AAAAAA'
+
+    cache_files = cache_dir.listdir()
+    assert len(cache_files) == 1
+    assert cache_files[0].read_binary() == __fake_clan_json__
+
+def test_get_cached_hit(tmpdir, monkeypatch):
+    api, cache_dir = get_api(tmpdir, monkeypatch, 'test_get_cached_hit')
+    api.get_cached('Clan', FakeApiMethod(), CLAN_TAG)
+
+    get_clan = FakeApiMethod()
+    clan = api.get_cached('Clan', get_clan, CLAN_TAG)
+
+    assert get_clan.calls == []
+    assert isinstance(clan, pyroyale.Clan)
+    assert clan.name == 'Fake Clan'
+
+def test_get_cached_expired_or_corrupt(tmpdir, monkeypatch):
+    api, cache_dir = get_api(tmpdir, monkeypatch, 'test_get_cached_expired_or_corrupt')
+    api.get_cached('Clan', FakeApiMethod(), CLAN_TAG)
+    cache_file = cache_dir.listdir()[0]
+
+    # expired cache is a miss
+    os.utime(str(cache_file), (0, 0))
+    get_clan = FakeApiMethod()
+    api.get_cached('Clan', get_clan, CLAN_TAG)
+    assert len(get_clan.calls) == 1
+
+    # truncated cache is a miss
+    cache_file.write_binary(__fake_clan_json__[:20])
+    get_clan = FakeApiMethod()
+    clan = api.get_cached('Clan', get_clan, CLAN_TAG)
+    assert len(get_clan.calls) == 1
+    assert clan.name == 'Fake Clan'
+
+def test_get_cached_unwritable(tmpdir, monkeypatch):
+    api, cache_dir = get_api(tmpdir, monkeypatch, 'test_get_cached_unwritable')
+    cache_dir.write('not a directory')
+
+    clan = api.get_cached('Clan', FakeApiMethod(), CLAN_TAG)
+
+    assert clan.name == 'Fake Clan'
+
+def test_get_cached_disabled(tmpdir, monkeypatch):
+    api, cache_dir = get_api(tmpdir, monkeypatch, 'test_get_cached_disabled')
+    api.config['api']['cache_ttl'] = 0
+
+    calls = []
+    def get_clan(clan_tag, **kwargs):
+        calls.append((clan_tag, kwargs))
+        return 'clan'
+
+    assert api.get_cached('Clan', get_clan, CLAN_TAG) == 'clan'
+    assert calls == [(CLAN_TAG, {})]
+    assert cache_dir.check(exists=0)
+
+def test_get_cached_non_integer_ttl(tmpdir, monkeypatch):
+    config_file = tmpdir.mkdir('test_get_cached_non_integer_ttl').join('config.ini')
+    config_file.write('[api]\nclan_id={}\ncache_ttl=1.5\n'.format(CLAN_TAG))
+    monkeypatch.setattr(api_wrapper, 'API_CACHE_DIR', str(tmpdir.join('test_get_cached_non_integer_ttl-cache')))
+    api = ApiWrapper(load_config_file(config_file.realpath()))
+
+    api.get_cached('Clan', FakeApiMethod(), CLAN_TAG)
+    get_clan = FakeApiMethod()
+    clan = api.get_cached('Clan', get_clan, CLAN_TAG)
+
+    assert get_clan.calls == []
+    assert clan.name == 'Fake Clan'
@@ -127,6 +127,35 @@ def test_config_paths_invalid(tmpdir):
     assert config['paths']['favicon'].endswith('/templates/crtools-favicon.ico')
     assert config['paths']['description_html_src'] == None
 
+def test_config_cache_ttl(tmpdir):
+    config_file = tmpdir.mkdir('test_config_cache_ttl').join('config.ini')
+
+    config = load_config_file(config_file.realpath())
+    assert config['api']['cache_ttl'] == 0
+
+    config_file.write('[api]\ncache_ttl=1.5\n')
+    config = load_config_file(config_file.realpath())
+    assert config['api']['cache_ttl'] == 1.5
+
+    for invalid_value in ['-1', 'nan', 'garbage', 'True']:
+        config_file.write('[api]\ncache_ttl={}\n'.format(invalid_value))
+        config = load_config_file(config_file.realpath())
+        assert config['api']['cache_ttl'] == 0
+
+def test_config_link_static_assets(tmpdir):
+    config_file = tmpdir.mkdir('test_config_link_static_assets').join('config.ini')
+
+    config = load_config_file(config_file.realpath())
+    assert config['paths']['link_static_assets'] == 'copy'
+
+    config_file.write('[paths]\nlink_static_assets=hardlink\n')
+    config = load_config_file(config_file.realpath())
+    assert config['paths']['link_static_assets'] == 'hardlink'
+
+    config_file.write('[paths]\nlink_static_assets=garbage\n')
+    config = load_config_file(config_file.realpath())
+    assert config['paths']['link_static_assets'] == 'copy'
+
 def test_config_paths_valid(tmpdir):
     test_tmpdir = tmpdir.mkdir('test_config_paths_valid')
     logo = test_tmpdir.join('logo.png')
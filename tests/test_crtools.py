@@ -342,3 +342,16 @@ def test_process_recent_wars(tmpdir):
     assert processed_warlog[0].date == '2/9'
     assert processed_warlog[0].trophy_change == 111
 
+
+def test_process_recent_wars_leaves_warlog_untouched(tmpdir):
+    config_file = tmpdir.mkdir('test_process_recent_wars_leaves_warlog_untouched').join('config.ini')
+    config_file.write(__config_file__)
+
+    config = load_config_file(config_file.realpath())
+
+    warlog = copy.deepcopy(__fake_warlog__)
+    processed_warlog = crtools.process_recent_wars(config, warlog)
+
+    assert warlog == __fake_warlog__
+    assert not hasattr(warlog.items[0].standings[0], 'rank')
+    assert processed_warlog[0].to_dict()['clan']['tag'] == CLAN_TAG
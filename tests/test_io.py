@@ -1,4 +1,8 @@
 import json
+import os
+import shutil
+
+from jinja2 import FileSystemBytecodeCache
 
 from crtools import io
 
@@ -23,6 +27,13 @@ def test_write_object_to_file(tmpdir):
 
     assert file_contents_object == json.loads(file_out_contents)
 
+    io.write_object_to_file(file_path, file_contents_text.encode('utf-8'))
+
+    with open(file_path, 'r') as myfile:
+        file_out_contents = myfile.read()
+
+    assert file_contents_text == file_out_contents
+
 def test_get_previous_history(tmpdir):
     fake_output_dir = tmpdir.mkdir('test_get_previous_history')
     history_file = fake_output_dir.join(io.HISTORY_FILE_NAME)
@@ -50,9 +61,42 @@ def test_copy_static_assets(tmpdir):
 
     assert fake_tempdir.join('static').check(dir=1)
     assert fake_tempdir.join('static').join('images').check(dir=1)
+    assert fake_tempdir.join('static').join('crtools.css').check(file=1)
+    assert fake_tempdir.join('static').check(link=0)
+    assert os.stat(str(fake_tempdir.join('static').join('crtools.css'))).st_nlink == 1
     assert fake_tempdir.join(io.CLAN_LOG_FILENAME).read() == 'foo'
     assert fake_tempdir.join(io.FAVICON_FILENAME).read() == 'bar'
 
+def test_copy_static_assets_symlink(tmpdir):
+    fake_tempdir = tmpdir.mkdir('test_copy_static_assets_symlink')
+    logo_source = fake_tempdir.join('fake_logo')
+    favicon_source = fake_tempdir.join('fake_favicon')
+
+    logo_source.write('foo')
+    favicon_source.write('bar')
+
+    io.copy_static_assets(fake_tempdir.realpath(), logo_source.realpath(), favicon_source.realpath(), 'symlink')
+
+    assert fake_tempdir.join('static').check(link=1)
+    assert fake_tempdir.join('static').join('crtools.css').check(file=1)
+
+def test_copy_static_assets_hardlink(tmpdir):
+    fake_tempdir = tmpdir.mkdir('test_copy_static_assets_hardlink')
+    logo_source = fake_tempdir.join('fake_logo')
+    favicon_source = fake_tempdir.join('fake_favicon')
+
+    logo_source.write('foo')
+    favicon_source.write('bar')
+
+    io.copy_static_assets(fake_tempdir.realpath(), logo_source.realpath(), favicon_source.realpath(), 'hardlink')
+
+    static_dir = fake_tempdir.join('static')
+    assert static_dir.check(dir=1, link=0)
+    assert os.path.samefile(str(static_dir.join('crtools.css')), os.path.join(io.STATIC_DIR, 'crtools.css'))
+
+    # don't leave links to the package's files lying around
+    shutil.rmtree(str(static_dir))
+
 def test_dump_debug_logs(tmpdir):
     fake_tempdir = tmpdir.mkdir('test_dump_debug_logs')
     obj = {'foo': 'bar'}
@@ -78,10 +122,12 @@ def test_move_temp_to_output_dir(tmpdir):
     test_subdir_name = 'bar'
     test_out_existing_filename = 'baz.txt'
     test_out_existing_dirname = 'quux'
+    test_out_existing_linkname = 'corge'
     fake_tempdir.join(test_file_name).write(test_file_contents)
     fake_tempdir.mkdir(test_subdir_name)
     fake_output_dir.join(test_out_existing_filename).write(test_out_existing_filename)
     fake_output_dir.mkdir(test_out_existing_dirname)
+    fake_output_dir.join(test_out_existing_linkname).mksymlinkto(fake_output_dir.join(test_out_existing_dirname))
 
     io.move_temp_to_output_dir(fake_tempdir.realpath(), fake_output_dir.realpath())
 
@@ -91,6 +137,7 @@ def test_move_temp_to_output_dir(tmpdir):
     assert fake_output_dir.join(test_subdir_name).check(dir=1)
     assert fake_output_dir.join(test_out_existing_filename).check(file=0)
     assert fake_output_dir.join(test_out_existing_dirname).check(dir=0)
+    assert not os.path.lexists(str(fake_output_dir.join(test_out_existing_linkname)))
 
 def test_move_temp_to_output_dir_output_dir_doesnt_exist(tmpdir):
     fake_tempdir = tmpdir.mkdir('test_move_temp_to_output_dir_output_dir_doesnt_exist-temp')
@@ -104,3 +151,71 @@ def test_move_temp_to_output_dir_output_dir_no_write(tmpdir):
     fake_output_dir.chmod(0)
 
     io.move_temp_to_output_dir(fake_tempdir.realpath(), fake_output_dir.realpath())
+
+def test_get_template(tmpdir, monkeypatch):
+    cache_dir = tmpdir.mkdir('test_get_template-cache')
+    monkeypatch.setattr(io, 'FileSystemBytecodeCache', lambda: FileSystemBytecodeCache(str(cache_dir)))
+    monkeypatch.setattr(io, '_jinja_env', None)
+    monkeypatch.setattr(io, '_templates', {})
+
+    template = io.get_template('robots.txt.j2')
+
+    assert template is io.get_template('robots.txt.j2')
+    assert len(cache_dir.listdir()) == 1
+    assert 'Sitemap: https://example.com/sitemap.xml' in template.render(canonical_url='https://example.com/')
+
+def test_dump_json():
+    obj = {'foo': ['bar', 1, None], 'baz': {'quux': True, 'name': 'Ünïcödé'}}
+
+    assert json.loads(io.dump_json(obj)) == obj
+    assert io.load_json(io.dump_json(obj)) == obj
+    assert json.loads(io.dump_json({1: 'foo'})) == {'1': 'foo'}
+
+def test_dump_json_without_orjson(monkeypatch):
+    obj = {'foo': ['bar', 1, None], 'baz': {'quux': True, 'name': 'Ünïcödé'}}
+    dumped_with_orjson = io.dump_json(obj)
+
+    monkeypatch.setattr(io, 'orjson', None)
+
+    assert io.dump_json(obj) == dumped_with_orjson
+    assert json.loads(io.dump_json(obj)) == obj
+    assert io.load_json(io.dump_json(obj)) == obj
+
+def test_make_temp_dir(tmpdir):
+    fake_output_dir = tmpdir.join('test_make_temp_dir-output')
+
+    temp_dir = io.make_temp_dir(str(fake_output_dir), 'crtools')
+
+    assert os.path.isdir(temp_dir)
+    assert temp_dir.endswith('crtools')
+    assert os.path.dirname(temp_dir) == str(tmpdir)
+
+    temp_dir = io.make_temp_dir('/obviously/fake/dir/output', 'crtools')
+
+    assert os.path.isdir(temp_dir)
+    os.rmdir(temp_dir)
+
+def test_get_bytecode_cache_unavailable(monkeypatch):
+    def fake_bytecode_cache():
+        raise RuntimeError('Cache directory is not owned by the current user')
+
+    monkeypatch.setattr(io, 'FileSystemBytecodeCache', fake_bytecode_cache)
+
+    assert io.get_bytecode_cache() is None
+
+def test_link_or_copy_file(tmpdir, monkeypatch):
+    fake_dir = tmpdir.mkdir('test_link_or_copy_file')
+    source = fake_dir.join('source')
+    source.write('foo')
+
+    io.link_or_copy_file(str(source), str(fake_dir.join('linked')))
+    assert fake_dir.join('linked').read() == 'foo'
+    assert os.path.samefile(str(source), str(fake_dir.join('linked')))
+
+    def fake_link(src, dst):
+        raise OSError('Invalid cross-device link')
+    monkeypatch.setattr(os, 'link', fake_link)
+
+    io.link_or_copy_file(str(source), str(fake_dir.join('copied')))
+    assert fake_dir.join('copied').read() == 'foo'
+    assert not os.path.samefile(str(source), str(fake_dir.join('copied')))
@@ -0,0 +1,6 @@
+from datetime import datetime
+
+from crtools import timeutil
+
+def test_parse_api_timestamp():
+    assert timeutil.parse_api_timestamp('20190213T012345.000Z') == datetime(2019, 2, 13, 1, 23, 45)